@@ -16,7 +16,7 @@ determines when an expansion is complete.
 
 from rapidfuzz import fuzz
 
-from .script_parser import ParsedScript, SpeakableWord, normalize_word
+from .script_parser import ParsedScript, normalize_word
 
 
 class ExpansionMatcher:
@@ -33,15 +33,32 @@ class ExpansionMatcher:
       - Position advances past "100"
     """
 
-    def __init__(self, parsed_script: ParsedScript) -> None:
+    def __init__(
+        self,
+        parsed_script: ParsedScript,
+        expansion_table: dict[int, list[list[str]]] | None = None
+    ) -> None:
         """
         Initialize the expansion matcher.
 
         Args:
             parsed_script: The parsed script containing speakable words
+            expansion_table: Precomputed lowercase expansions per expandable
+                speakable index (shared by clones; built if not given)
         """
         self.parsed_script: ParsedScript = parsed_script
 
+        # Lowercase expansions for each expandable position, built once per
+        # script so matching doesn't re-derive them for every spoken word.
+        # The inner lists are never mutated, so they are shared freely.
+        if expansion_table is None:
+            expansion_table = {
+                idx: [[word.lower() for word in exp] for exp in sw.all_expansions]
+                for idx, sw in enumerate(parsed_script.speakable_words)
+                if sw.is_expansion and sw.all_expansions
+            }
+        self._expansion_table: dict[int, list[list[str]]] = expansion_table
+
         # Dynamic expansion matching state
         self.active_expansions: list[list[str]] = []
         self.expansion_match_position: int = 0
@@ -64,20 +81,13 @@ class ExpansionMatcher:
         if speakable_idx >= len(self.parsed_script.speakable_words):
             return []
 
-        sw: SpeakableWord = self.parsed_script.speakable_words[speakable_idx]
-
-        if sw.is_expansion and sw.all_expansions:
-            # Get the first word from each expansion
-            first_words: list[str] = []
-            for exp in sw.all_expansions:
-                if exp:
-                    word: str = exp[0].lower()
-                    if word not in first_words:
-                        first_words.append(word)
-            return first_words
+        expansions: list[list[str]] | None = self._expansion_table.get(speakable_idx)
+        if expansions is not None:
+            # Get the first word from each expansion (deduplicated, in order)
+            return list(dict.fromkeys(exp[0] for exp in expansions if exp))
 
         # For regular words, just return the word itself
-        return [sw.text]
+        return [self.parsed_script.speakable_words[speakable_idx].text]
 
     def start(self, speakable_idx: int) -> bool:
         """
@@ -94,11 +104,10 @@ class ExpansionMatcher:
         if speakable_idx >= len(self.parsed_script.speakable_words):
             return False
 
-        sw: SpeakableWord = self.parsed_script.speakable_words[speakable_idx]
-
-        if sw.is_expansion and sw.all_expansions:
-            self.active_expansions = [exp[:]
-                                      for exp in sw.all_expansions]  # Copy
+        expansions: list[list[str]] | None = self._expansion_table.get(speakable_idx)
+        if expansions is not None:
+            # Shallow copy: filtering replaces the list, never the expansions
+            self.active_expansions = list(expansions)
             self.expansion_match_position = 0
             return True
 
@@ -128,12 +137,20 @@ class ExpansionMatcher:
 
         pos: int = self.expansion_match_position
         remaining: list[list[str]] = []
+        # Many expansions share words at the same position (e.g. "one hundred"
+        # and "one zero zero"), so score each distinct word only once
+        word_matches: dict[str, bool] = {}
 
         for exp in self.active_expansions:
             if pos < len(exp):
-                exp_word: str = exp[pos].lower()
-                # Check for exact or fuzzy match
-                if spoken_norm == exp_word or fuzz.ratio(spoken_norm, exp_word) >= 75:
+                exp_word: str = exp[pos]
+                is_match: bool | None = word_matches.get(exp_word)
+                if is_match is None:
+                    # Check for exact or fuzzy match
+                    is_match = spoken_norm == exp_word or fuzz.ratio(
+                        spoken_norm, exp_word, score_cutoff=75) >= 75
+                    word_matches[exp_word] = is_match
+                if is_match:
                     remaining.append(exp)
 
         if remaining:
@@ -158,13 +175,16 @@ class ExpansionMatcher:
 
     def clear(self) -> None:
         """Clear the expansion matching state."""
-        self.active_expansions = []
+        # Called on every failed/skipped match, usually with nothing active,
+        # so only allocate a fresh list when there is something to drop
+        if self.active_expansions:
+            self.active_expansions = []
         self.expansion_match_position = 0
 
     def clone(self) -> "ExpansionMatcher":
         """Clone the expansion matcher state."""
-        result = ExpansionMatcher(self.parsed_script)
-        result.active_expansions = [xs.copy() for xs in self.active_expansions]
+        result = ExpansionMatcher(self.parsed_script, self._expansion_table)
+        result.active_expansions = list(self.active_expansions)
         result.expansion_match_position = self.expansion_match_position
         return result
 
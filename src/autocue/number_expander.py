@@ -22,6 +22,7 @@ Numbers with units support comma separators (e.g., 300,000km).
 """
 
 import re
+from functools import lru_cache
 from re import Pattern
 
 from num2words import num2words
@@ -757,6 +758,29 @@ def get_number_expansions(token: str) -> list[list[str]] | None:
     if not stripped:
         return None
 
+    # Return fresh lists so callers can't mutate the shared cached result
+    expansions: tuple[tuple[str, ...], ...] | None = _cached_number_expansions(stripped)
+    if expansions is None:
+        return None
+    return [list(exp) for exp in expansions]
+
+
+@lru_cache(maxsize=4096)
+def _cached_number_expansions(stripped: str) -> tuple[tuple[str, ...], ...] | None:
+    """Cached, immutable form of get_number_expansions.
+
+    Scripts (and trackers created for the same script) repeat the same
+    number tokens, and expanding them goes through num2words, so results
+    are shared across calls.
+    """
+    result: list[list[str]] | None = _expand_number_token(stripped)
+    if result is None:
+        return None
+    return tuple(tuple(exp) for exp in result)
+
+
+def _expand_number_token(stripped: str) -> list[list[str]] | None:
+    """Uncached body of get_number_expansions for a stripped, non-empty token."""
     # Try ordinal first (most specific pattern with suffix)
     if PATTERNS['ordinal'].match(stripped):
         return expand_ordinal(stripped)
@@ -245,4 +245,5 @@ class VoskProvider(TranscriptionProvider):
         Returns:
             True if the text is a known artifact that should be filtered out
         """
-        return text.lower() == "the"
+        # Most results aren't three characters long, so skip lowercasing them
+        return len(text) == 3 and text.lower() == "the"
@@ -13,6 +13,7 @@ punctuation is spoken aloud (e.g., "&" as "and", "<" as "less than").
 """
 
 import re
+import sys
 from dataclasses import dataclass, field
 from functools import lru_cache
 from html.parser import HTMLParser
@@ -54,6 +55,13 @@ PUNCTUATION_EXPANSIONS: dict[str, list[list[str]]] = {
     "*": [["times"], ["multiply"], ["multiplied"]],
 }
 
+# Expandable punctuation that is split out of longer tokens (e.g. "2^3").
+# Minus and forward slash are excluded: they may be part of negative numbers
+# or unit names. Precomputed so per-token preprocessing does O(1) lookups.
+_SPLIT_PUNCTUATION: frozenset[str] = frozenset(PUNCTUATION_EXPANSIONS) - {'-', '/'}
+_MULTI_CHAR_SPLIT_PUNCTUATION: tuple[str, ...] = tuple(
+    punct for punct in _SPLIT_PUNCTUATION if len(punct) > 1)
+
 # Punctuation that should be silently dropped (not spoken)
 # These are punctuation marks that don't get vocalized
 SILENT_PUNCTUATION: frozenset[str] = frozenset([
@@ -127,14 +135,33 @@ class ParsedScript:
         return self.raw_tokens[raw_idx]
 
 
-@lru_cache(maxsize=512)
+# Characters stripped by normalize_word: anything that is neither a word
+# character nor whitespace
+_NON_WORD_RE: re.Pattern[str] = re.compile(r'[^\w\s]')
+
+# The ASCII subset of _NON_WORD_RE as a str.translate deletion table, so the
+# common all-ASCII case is a single C-level pass with no regex
+_ASCII_NON_WORD_TABLE: dict[int, int | None] = str.maketrans(
+    '', '', ''.join(c for c in map(chr, range(128)) if _NON_WORD_RE.match(c)))
+
+# Runs of two or more periods (ellipses), condensed by preprocess_periods
+_REPEATED_PERIODS_RE: re.Pattern[str] = re.compile(r'\.{2,}')
+
+
+@lru_cache(maxsize=4096)
 def normalize_word(word: str) -> str:
     """Normalize a word for matching (lowercase, strip punctuation).
 
     This is used for comparing spoken words to script words.
-    Cached with LRU cache (maxsize=512) for performance.
+    Cached with LRU cache (maxsize=4096) for performance. Results are
+    interned so equal normalized words are usually the same object, letting
+    string comparisons in the matching loops short-circuit on identity.
     """
-    return re.sub(r'[^\w\s]', '', word.lower()).strip()
+    lowered: str = word.lower()
+    if lowered.isascii():
+        return sys.intern(lowered.translate(_ASCII_NON_WORD_TABLE).strip())
+    # Non-ASCII input may contain Unicode punctuation (curly quotes, dashes)
+    return sys.intern(_NON_WORD_RE.sub('', lowered).strip())
 
 
 def strip_surrounding_punctuation(token: str) -> str:
@@ -242,8 +269,7 @@ def preprocess_periods(token: str) -> list[str]:
         return []
 
     # First, condense multiple periods to a single period
-    import re
-    condensed = re.sub(r'\.{2,}', '.', token)
+    condensed = _REPEATED_PERIODS_RE.sub('.', token)
 
     # Check if it's just a standalone period after condensing
     if condensed == '.':
@@ -352,10 +378,6 @@ def _preprocess_token_for_other_punctuation(token: str) -> list[str]:
     if is_number_token(token.strip()):
         return [token]
 
-    # Get punctuation characters that should be split out
-    # Exclude minus and forward slash as requested
-    split_punctuation = set(PUNCTUATION_EXPANSIONS.keys()) - {'-', '/'}
-
     # Build a list of sub-tokens by splitting on punctuation
     result: list[str] = []
     current: str = ""
@@ -367,8 +389,8 @@ def _preprocess_token_for_other_punctuation(token: str) -> list[str]:
         # Check if this is a multi-character operator we should split
         # (e.g., "<=", ">=")
         found_multi_char = False
-        for punct in split_punctuation:
-            if len(punct) > 1 and token[i:i+len(punct)] == punct:
+        for punct in _MULTI_CHAR_SPLIT_PUNCTUATION:
+            if token.startswith(punct, i):
                 # Found a multi-character punctuation
                 if current:
                     result.append(current)
@@ -382,7 +404,7 @@ def _preprocess_token_for_other_punctuation(token: str) -> list[str]:
             continue
 
         # Check single-character punctuation
-        if char in split_punctuation:
+        if char in _SPLIT_PUNCTUATION:
             # Split out the punctuation
             if current:
                 result.append(current)
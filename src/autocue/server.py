@@ -29,6 +29,9 @@ from .script_parser import ParsedScript, RawToken, parse_script
 
 logger = logging.getLogger(__name__)
 
+# Splits text into words and the whitespace runs between them (kept)
+_WHITESPACE_SPLIT_RE: re.Pattern[str] = re.compile(r'(\s+)')
+
 
 class WordIndexingHTMLParser(HTMLParser):
     """HTML parser that wraps text words with span elements containing raw token indices.
@@ -88,7 +91,7 @@ class WordIndexingHTMLParser(HTMLParser):
             return
 
         # Split text into words and whitespace, preserving order
-        parts = re.split(r'(\s+)', data)
+        parts = _WHITESPACE_SPLIT_RE.split(data)
         result = []
 
         for part in parts:
@@ -9,16 +9,19 @@ detects when the speaker backtracks to restart a sentence.
 """
 
 import logging
-from collections import OrderedDict
+from bisect import bisect_left
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 import markdown
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 
 from .expansion_matcher import ExpansionMatcher
 from .profiling import profile_function
 from .script_parser import (
     ParsedScript,
+    SpeakableWord,
     get_speakable_word_list,
     normalize_word,
     parse_script,
@@ -28,11 +31,27 @@ from .script_parser import (
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=16)
+def _parse_script_text(script_text: str) -> ParsedScript:
+    """Render a script's markdown and parse it.
+
+    Cached because the same script is often loaded by several trackers
+    (e.g. ThreadedTracker's worker plus its ``words`` helper, or a reload),
+    and rendering plus number expansion dominates construction. The
+    ParsedScript is never modified after parsing, so sharing it is safe.
+    """
+    rendered_html: str = markdown.markdown(
+        script_text,
+        extensions=['nl2br', 'sane_lists']
+    )
+    return parse_script(script_text, rendered_html)
+
+
 @dataclass
 class TrackingState:
     """Encapsulates the state needed for tracking progress through the script."""
     optimistic_position: int = 0
-    word_queue: list[str] = field(default_factory=list)
+    word_queue: deque[str] = field(default_factory=deque)
     last_matched_spoken: str | None = None
     expansion_matcher: 'ExpansionMatcher | None' = None
     last_transcription: str = ""  # Last final transcription processed by this state
@@ -73,7 +92,7 @@ class ScriptLine:
     html: str = ""  # HTML rendered version (for Markdown)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SingleWordMatchResult:
     """Result of trying to match a single word."""
     matched: bool
@@ -81,13 +100,24 @@ class SingleWordMatchResult:
     skipped: bool
 
 
-@dataclass
+# The only outcomes _match_single_word can produce, shared rather than
+# allocated for every spoken word
+_NO_MATCH = SingleWordMatchResult(False, False, False)
+_MATCHED_AND_ADVANCED = SingleWordMatchResult(True, True, False)
+_MATCHED_IN_EXPANSION = SingleWordMatchResult(True, False, False)
+_MATCHED_AND_SKIPPED = SingleWordMatchResult(True, False, True)
+
+
+@dataclass(frozen=True, slots=True)
 class ManyWordMatchResult:
     """Result of trying to match multiple words."""
     matches: int
     advances: int
 
 
+_NO_MATCHES = ManyWordMatchResult(0, 0)
+
+
 class ScriptTracker:
     """
     Tracks position in a script based on spoken words.
@@ -105,12 +135,20 @@ class ScriptTracker:
     jump_threshold: int
     max_jump_distance: int
     max_skip_distance: int
+    skip_headers: bool
 
     parsed_script: ParsedScript
     words: list[str]
     lines: list[ScriptLine]
     word_to_line: list[int]
 
+    # Precomputed lookup tables (built once at construction)
+    _norm_words: list[str]
+    _word_index: dict[str, list[int]]
+    _window_texts: list[str]
+    _window_word_counts: list[int]
+    _next_non_header: list[int]
+
     current_word_index: int
     last_transcription: str
     words_since_validation: int
@@ -125,6 +163,11 @@ class ScriptTracker:
 
     _expansion_matcher: ExpansionMatcher
 
+    # Result caches
+    _match_cache: OrderedDict[tuple[str, int], tuple[int, float]]
+    _match_cache_maxsize: int
+    _position_match_cache: OrderedDict[tuple[tuple[str, ...], int], bool]
+
     def __init__(
         self,
         script_text: str,
@@ -156,19 +199,39 @@ class ScriptTracker:
         self.max_skip_distance = max_skip_distance
         self.skip_headers = skip_headers
 
-        # Render markdown to HTML first
-        rendered_html: str = markdown.markdown(
-            script_text,
-            extensions=['nl2br', 'sane_lists']
-        )
-
         # Parse script using three-version parser with rendered HTML
-        self.parsed_script: ParsedScript = parse_script(
-            script_text, rendered_html)
+        # (shared with other trackers created for the same script text)
+        self.parsed_script: ParsedScript = _parse_script_text(script_text)
 
         # Speakable words for matching (what the user will say)
         self.words: list[str] = get_speakable_word_list(self.parsed_script)
 
+        # Normalized script words (as compared against spoken words) and an
+        # inverted index of normalized word -> sorted script positions, so exact
+        # matches can be located without scanning the script
+        self._norm_words: list[str] = [normalize_word(w) for w in self.words]
+        self._word_index: dict[str, list[int]] = {}
+        for i, norm in enumerate(self._norm_words):
+            if norm:
+                self._word_index.setdefault(norm, []).append(i)
+
+        # Window text (and its token count) starting at each script position,
+        # built once so window-based matching doesn't re-join and re-split the
+        # same script words for every candidate position on every search
+        self._window_texts: list[str] = [
+            ' '.join(self.words[i:i + window_size]) for i in range(len(self.words))]
+        self._window_word_counts: list[int] = [
+            len(text.split()) for text in self._window_texts]
+
+        # Index of the first non-header word at or after each position (with a
+        # trailing sentinel), so skipping a header block is a single lookup
+        # rather than a walk over SpeakableWord objects on every spoken word
+        speakable_words = self.parsed_script.speakable_words
+        self._next_non_header: list[int] = [len(speakable_words)] * (len(speakable_words) + 1)
+        for i in range(len(speakable_words) - 1, -1, -1):
+            self._next_non_header[i] = (
+                self._next_non_header[i + 1] if speakable_words[i].is_header else i)
+
         # Build lines for display from raw text (for legacy compatibility)
         self.lines: list[ScriptLine] = []
         self.word_to_line: list[int] = []
@@ -188,7 +251,7 @@ class ScriptTracker:
         # Committed state - only updated by final transcripts
         self.committed_state = TrackingState(
             optimistic_position=0,
-            word_queue=[],
+            word_queue=deque(),
             last_matched_spoken=None,
             expansion_matcher=self._expansion_matcher.clone(),
             last_transcription=""
@@ -208,6 +271,12 @@ class ScriptTracker:
         self._match_cache: OrderedDict[tuple[str, int], tuple[int, float]] = OrderedDict()
         self._match_cache_maxsize: int = 128
 
+        # Cache for nearby-transcript checks made during jump detection
+        # Key: (last few transcript words, position)
+        # Value: whether they match the script around that position
+        # Consecutive transcripts usually share their tail, so these repeat
+        self._position_match_cache: OrderedDict[tuple[tuple[str, ...], int], bool] = OrderedDict()
+
     # Property accessors for expansion state (delegated to ExpansionMatcher)
     @property
     def active_expansions(self) -> list[list[str]]:
@@ -272,19 +341,29 @@ class ScriptTracker:
         """Clear the expansion matching state."""
         self._expansion_matcher.clear()
 
-    def _get_window_text(self, start_index: int) -> str:
-        """Get a window of words starting at the given index."""
-        end_index: int = min(start_index + self.window_size, len(self.words))
-        return ' '.join(self.words[start_index:end_index])
-
-    def _word_matches(self, spoken: str, script: str) -> bool:
-        """Check if a spoken word matches a script word (with fuzzy tolerance).
+    def _find_exact_occurrence(self, norm_word: str, start: int, end: int) -> int:
+        """Find the first script position in [start, end) whose normalized word
+        exactly equals norm_word, using the inverted word index.
 
-        Uses stricter matching than window-based matching since we have less context.
+        Returns:
+            The script position, or -1 if there is no exact occurrence in range.
+        """
+        positions: list[int] | None = self._word_index.get(norm_word)
+        if not positions:
+            return -1
+        i: int = bisect_left(positions, start)
+        if i < len(positions) and positions[i] < end:
+            return positions[i]
+        return -1
+
+    def _normalized_words_match(self, spoken_norm: str, script_norm: str) -> bool:
+        """Check if a normalized spoken word matches a normalized script word
+        (with fuzzy tolerance).
+
+        Uses stricter matching than window-based matching since we have less
+        context. Script scans pass the precomputed _norm_words so script words
+        are not re-normalized on every comparison.
         """
-        spoken_norm: str = self._normalize_word(spoken)
-        script_norm: str = self._normalize_word(script)
-
         if not spoken_norm or not script_norm:
             return False
 
@@ -292,18 +371,40 @@ class ScriptTracker:
         if spoken_norm == script_norm:
             return True
 
-        # Fuzzy match for speech recognition errors
-        return fuzz.ratio(spoken_norm, script_norm) >= self.match_threshold
+        # Length prefilter: fuzz.ratio is at most 200 * shorter / (sum of
+        # lengths), so words of very different lengths can never reach the
+        # threshold and the fuzzy call can be skipped
+        spoken_len: int = len(spoken_norm)
+        script_len: int = len(script_norm)
+        if 200 * min(spoken_len, script_len) < self.match_threshold * (spoken_len + script_len):
+            return False
+
+        # Fuzzy match for speech recognition errors (score_cutoff lets
+        # rapidfuzz bail out early on clear mismatches)
+        return fuzz.ratio(spoken_norm, script_norm,
+                          score_cutoff=self.match_threshold) >= self.match_threshold
 
     def extract_new_words(self, transcription: str, state: TrackingState) -> list[str]:
         """
         Extract only the NEW words from the transcription.
         Compares with state's last_transcription to find what was just spoken.
         """
-        current_words: list[str] = [
-            w for w in transcription.split() if w.strip()]
-        last_words: list[str] = [
-            w for w in state.last_transcription.split() if w.strip()]
+        last_transcription: str = state.last_transcription
+
+        # Fast path: the transcription extends the previous one at a word
+        # boundary, so only the appended suffix needs splitting
+        prefix_len: int = len(last_transcription)
+        if transcription.startswith(last_transcription) and (
+            prefix_len == 0
+            or prefix_len == len(transcription)
+            or transcription[prefix_len].isspace()
+            or last_transcription[-1].isspace()
+        ):
+            return transcription[prefix_len:].split()
+
+        # str.split() with no separator never yields empty or whitespace tokens
+        current_words: list[str] = transcription.split()
+        last_words: list[str] = last_transcription.split()
 
         # Find where the new words start
         # Usually the new transcription extends the previous one
@@ -319,11 +420,8 @@ class ScriptTracker:
                 break
 
         # Return words after the matching prefix
-        if match_len > 0:
-            return current_words[match_len:]
-
-        # If no prefix match, this is a new utterance
-        return current_words
+        # (if no prefix match, this is a new utterance)
+        return current_words[match_len:]
 
     # Common filler words to skip during optimistic matching
     FILLER_WORDS: frozenset[str] = frozenset([
@@ -333,10 +431,6 @@ class ScriptTracker:
         'literally', 'honestly', 'right', 'okay', 'ok', 'yeah', 'yes', 'no'
     ])
 
-    def _is_filler_word(self, word: str) -> bool:
-        """Check if a word is a common filler word that can be skipped."""
-        return self._normalize_word(word) in self.FILLER_WORDS
-
     @profile_function("tracker.update")
     def update(self, transcription: str, is_partial: bool = False) -> ScriptPosition:
         """
@@ -359,7 +453,9 @@ class ScriptTracker:
             Updated ScriptPosition (uses optimistic position for responsiveness)
         """
         transcription = transcription.strip()
-        if not transcription:
+        # Nothing to match against in an empty script, so skip the matching
+        # machinery entirely (the position can only ever be 0)
+        if not transcription or not self.words:
             return self.current_position
 
         if is_partial:
@@ -379,17 +475,16 @@ class ScriptTracker:
         if transcription == self.last_partial_transcription:
             return self.current_position
 
-        logger.info(f"Partial: Processing '{transcription}'")
+        logger.info("Partial: Processing '%s'", transcription)
 
         # Clone committed state for speculative matching
         speculative_state = self.committed_state.clone()
 
         # Add all words from the partial transcript to speculative state
-        partial_words = [w for w in transcription.split() if w.strip()]
+        partial_words = transcription.split()
         logger.debug(
-            f"Partial: Queuing {len(partial_words)} words from partial")
-        for word in partial_words:
-            speculative_state.word_queue.append(word)
+            "Partial: Queuing %d words from partial", len(partial_words))
+        speculative_state.word_queue.extend(partial_words)
 
         # Sync expansion matcher for speculative processing
         if speculative_state.expansion_matcher:
@@ -405,12 +500,12 @@ class ScriptTracker:
         while speculative_state.word_queue:
             initial_queue_len = len(speculative_state.word_queue)
             logger.debug(
-                f"Partial: {initial_queue_len} unmatched words remain, attempting recovery")
+                "Partial: %d unmatched words remain, attempting recovery", initial_queue_len)
 
             # Drop the first unmatched word and try again
-            dropped_word = speculative_state.word_queue.pop(0)
+            dropped_word = speculative_state.word_queue.popleft()
             logger.debug(
-                f"Partial: Dropping word '{dropped_word}' and retrying")
+                "Partial: Dropping word '%s' and retrying", dropped_word)
 
             # Try processing remaining words
             if speculative_state.word_queue:
@@ -421,12 +516,14 @@ class ScriptTracker:
                 # If we made progress (queue got shorter), keep trying
                 if len(speculative_state.word_queue) < initial_queue_len - 1:
                     logger.info(
-                        f"Partial: Recovery successful, {initial_queue_len - 1 - len(speculative_state.word_queue)} more words matched")
+                        "Partial: Recovery successful, %d more words matched",
+                        initial_queue_len - 1 - len(speculative_state.word_queue))
 
         # Update speculative display position (never goes backwards)
         if speculative_state.optimistic_position > self.speculative_display_position:
             logger.debug(
-                f"Partial: Advancing speculative position from {self.speculative_display_position} to {speculative_state.optimistic_position}")
+                "Partial: Advancing speculative position from %d to %d",
+                self.speculative_display_position, speculative_state.optimistic_position)
             self.speculative_display_position = speculative_state.optimistic_position
 
         # Restore committed state expansion matcher
@@ -449,7 +546,7 @@ class ScriptTracker:
 
         Updates committed state and clears speculative state.
         """
-        logger.info(f"Final: Processing '{transcription}'")
+        logger.info("Final: Processing '%s'", transcription)
 
         # Extract only the NEW words from the transcription
         new_words: list[str] = self.extract_new_words(
@@ -461,14 +558,17 @@ class ScriptTracker:
             self.last_partial_transcription = ""
             return self.current_position
 
-        logger.debug("-------------------------------------------")
-        logger.debug(
-            f"Tracker: Word queue '{' '.join(self.committed_state.word_queue)}'")
-        logger.debug(f"Tracker: New words '{' '.join(new_words)}'")
-        for word in new_words:
-            self.committed_state.word_queue.append(word)
-        logger.debug(
-            f"Tracker: Updated word queue '{' '.join(self.committed_state.word_queue)}'")
+        # Only build the word-queue dumps when debug logging is on
+        debug_enabled: bool = logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            logger.debug("-------------------------------------------")
+            logger.debug(
+                "Tracker: Word queue '%s'", ' '.join(self.committed_state.word_queue))
+            logger.debug("Tracker: New words '%s'", ' '.join(new_words))
+        self.committed_state.word_queue.extend(new_words)
+        if debug_enabled:
+            logger.debug(
+                "Tracker: Updated word queue '%s'", ' '.join(self.committed_state.word_queue))
 
         # Sync expansion matcher
         if self.committed_state.expansion_matcher:
@@ -485,11 +585,11 @@ class ScriptTracker:
         while self.committed_state.word_queue:
             initial_queue_len = len(self.committed_state.word_queue)
             logger.debug(
-                f"Final: {initial_queue_len} unmatched words remain, attempting recovery")
+                "Final: %d unmatched words remain, attempting recovery", initial_queue_len)
 
             # Drop the first unmatched word and try again
-            dropped_word = self.committed_state.word_queue.pop(0)
-            logger.debug(f"Final: Dropping word '{dropped_word}' and retrying")
+            dropped_word = self.committed_state.word_queue.popleft()
+            logger.debug("Final: Dropping word '%s' and retrying", dropped_word)
 
             # Try processing remaining words
             if self.committed_state.word_queue:
@@ -499,18 +599,21 @@ class ScriptTracker:
                 # If we made progress (queue got shorter), keep trying
                 if len(self.committed_state.word_queue) < initial_queue_len - 1:
                     logger.info(
-                        f"Final: Recovery successful, {initial_queue_len - 1 - len(self.committed_state.word_queue)} more words matched")
+                        "Final: Recovery successful, %d more words matched",
+                        initial_queue_len - 1 - len(self.committed_state.word_queue))
 
         # Clear any remaining words that still couldn't be matched
         if self.committed_state.word_queue:
             logger.info(
-                f"Final: Discarding {len(self.committed_state.word_queue)} remaining unmatched words")
+                "Final: Discarding %d remaining unmatched words",
+                len(self.committed_state.word_queue))
             self.committed_state.word_queue.clear()
 
         # Update committed display position
         direction = "forward" if self.committed_display_position < self.committed_state.optimistic_position else "backward"
         logger.info(
-            f"Final({direction}): Moving committed position from {self.committed_display_position} to {self.committed_state.optimistic_position}")
+            "Final(%s): Moving committed position from %d to %d",
+            direction, self.committed_display_position, self.committed_state.optimistic_position)
         self.committed_display_position = self.committed_state.optimistic_position
 
         # Update expansion matcher in committed state
@@ -537,7 +640,7 @@ class ScriptTracker:
         # Reset committed state
         self.committed_state = TrackingState(
             optimistic_position=0,
-            word_queue=[],
+            word_queue=deque(),
             last_matched_spoken=None,
             expansion_matcher=self._expansion_matcher.clone(),
             last_transcription=""
@@ -548,8 +651,9 @@ class ScriptTracker:
         self.last_partial_transcription = ""
         # Reset expansion state
         self.clear_expansion_state()
-        # Clear match cache (Phase 2 optimization)
+        # Clear match caches (Phase 2 optimization)
         self._match_cache.clear()
+        self._position_match_cache.clear()
 
     def jump_to(self, word_index: int) -> None:
         """Jump to a specific position in the script."""
@@ -610,15 +714,15 @@ class ScriptTracker:
         if update_validation_counter:
             self.last_update_was_jump = False
 
-        previous_length = len(state.word_queue) + 1
+        previous_length: int = len(state.word_queue) + 1
         while bool(state.word_queue) and previous_length > len(state.word_queue):
             previous_length = len(state.word_queue)
 
             # Try to advance optimistically based on new words
-            spoken_word = state.word_queue.pop(0)
+            spoken_word: str = state.word_queue.popleft()
             logger.debug(
-                f"Exact-match detection: Testing word '{spoken_word}'")
-            match_result = self._match_single_word(spoken_word, state)
+                "Exact-match detection: Testing word '%s'", spoken_word)
+            match_result: SingleWordMatchResult = self._match_single_word(spoken_word, state)
 
             if match_result.matched:
                 state.last_matched_spoken = spoken_word
@@ -636,20 +740,21 @@ class ScriptTracker:
             else:
                 state.last_matched_spoken = None
 
-                state.word_queue.insert(0, spoken_word)
+                state.word_queue.appendleft(spoken_word)
                 # Only use skip logic if not disabled
+                skip_result: ManyWordMatchResult
                 if self.skip_disabled_count == 0:
-                    match_result = self._match_words_with_skipping(
+                    skip_result = self._match_words_with_skipping(
                         state, max_skip_distance)
                 else:
-                    match_result = ManyWordMatchResult(0, 0)
-                if match_result.matches > 0:
+                    skip_result = _NO_MATCHES
+                if skip_result.matches > 0:
                     # Update optimistic position
-                    state.optimistic_position += match_result.advances
+                    state.optimistic_position += skip_result.advances
 
                     # Track words for validation triggering (only for final updates)
                     if update_validation_counter:
-                        self.words_since_validation += match_result.advances
+                        self.words_since_validation += skip_result.advances
                 # Else check for backtrack / forward jump
                 # Skip jump detection for partial updates (performance optimization)
                 # allow_jump_detection
@@ -674,31 +779,26 @@ class ScriptTracker:
         If skip_headers is enabled, automatically skips over header words.
         Returns whether the word was matched, and whether to advance in the script.
         """
-        optimistic_position = state.optimistic_position
+        optimistic_position: int = state.optimistic_position
 
         if optimistic_position >= len(self.words):
-            return SingleWordMatchResult(False, False, False)
+            return _NO_MATCH
 
         # Auto-skip header words if skip_headers is enabled
         if self.skip_headers:
-            speakable_words = self.parsed_script.speakable_words
-            while optimistic_position < len(speakable_words):
-                sw = speakable_words[optimistic_position]
-                if sw.is_header:
-                    # Skip this header word
-                    optimistic_position += 1
-                    state.optimistic_position = optimistic_position
-                else:
-                    break
+            next_position: int = self._next_non_header[optimistic_position]
+            if next_position != optimistic_position:
+                optimistic_position = next_position
+                state.optimistic_position = optimistic_position
 
         if optimistic_position >= len(self.words):
-            return SingleWordMatchResult(False, False, False)
+            return _NO_MATCH
 
         spoken_norm: str = self._normalize_word(spoken_word)
 
         # Skip empty words
         if not spoken_norm:
-            return SingleWordMatchResult(True, False, True)
+            return _MATCHED_AND_SKIPPED
 
         # 1. Try detection against the script first
         #    - optimistic assumption that the speaker didn't mess up
@@ -714,8 +814,8 @@ class ScriptTracker:
                 # Check if expansion is complete
                 if self._is_expansion_complete():
                     self.clear_expansion_state()
-                    return SingleWordMatchResult(True, True, False)
-                return SingleWordMatchResult(True, False, False)
+                    return _MATCHED_AND_ADVANCED
+                return _MATCHED_IN_EXPANSION
             else:
                 # Word doesn't match any remaining expansion
                 # Expansion ended early - advance position and try this word at next pos
@@ -733,37 +833,44 @@ class ScriptTracker:
                     # Check if single-word expansion is complete
                     if self._is_expansion_complete():
                         self.clear_expansion_state()
-                        return SingleWordMatchResult(True, True, False)
-                    return SingleWordMatchResult(True, False, False)
+                        return _MATCHED_AND_ADVANCED
+                    return _MATCHED_IN_EXPANSION
                 else:
                     # First word doesn't match any expansion - clear and fall through
                     self.clear_expansion_state()
             else:
-                # Regular word - try direct matching
-                # Exact match
-                if spoken_norm == sw or fuzz.ratio(spoken_norm, sw.text) >= self.match_threshold:
-                    return SingleWordMatchResult(True, True, False)
+                # Regular word - try direct matching (exact, then bounded fuzzy)
+                if self._normalized_words_match(spoken_norm, sw.text):
+                    return _MATCHED_AND_ADVANCED
 
-        if self._is_filler_word(spoken_norm):
-            return SingleWordMatchResult(True, False, True)
+        # spoken_norm is already normalized, so check the set directly
+        if spoken_norm in self.FILLER_WORDS:
+            return _MATCHED_AND_SKIPPED
 
         # Skip repeated words (same word spoken twice in a row)
         if state.last_matched_spoken and spoken_norm == self._normalize_word(state.last_matched_spoken):
-            return SingleWordMatchResult(True, False, True)
+            return _MATCHED_AND_SKIPPED
 
-        return SingleWordMatchResult(False, False, False)
+        return _NO_MATCH
 
     @profile_function("tracker._match_words_with_skipping")
     def _match_words_with_skipping(self, state: TrackingState, max_skip_distance: int) -> ManyWordMatchResult:
-        def try_matching(variant_name: str, optimism_mode: int, tmp_optimistic_position: int):
+        # Checked once per call: only the word-queue dumps need guarding, as
+        # they are built before the logger can decide to drop them
+        debug_enabled: bool = logger.isEnabledFor(logging.DEBUG)
+        speakable_words = self.parsed_script.speakable_words
+        num_speakable: int = len(speakable_words)
+        match_single_word = self._match_single_word
+
+        def try_matching(variant_name: str, optimism_mode: int, tmp_optimistic_position: int) -> ManyWordMatchResult:
             # Clone state to work on - only copy back if successful
-            temp_state = state.clone()
+            temp_state: TrackingState = state.clone()
             temp_state.optimistic_position = tmp_optimistic_position
 
-            speakable_words = self.parsed_script.speakable_words
-            logger.debug(
-                f"Skip detection ({variant_name}): Current word queue: '{' '.join(temp_state.word_queue)}'"
-            )
+            if debug_enabled:
+                logger.debug(
+                    "Skip detection (%s): Current word queue: '%s'",
+                    variant_name, ' '.join(temp_state.word_queue))
 
             skip_count: int = 0
             match_count: int = 0
@@ -779,13 +886,13 @@ class ScriptTracker:
                 # And we're making some progress
                 and (skip_count > previous_skip_count or match_count > previous_match_count)
                 # And we're in-bounds of the script
-                and temp_state.optimistic_position < len(speakable_words)
+                and temp_state.optimistic_position < num_speakable
             ):
                 previous_skip_count = skip_count
                 previous_match_count = match_count
 
-                spoken_word = temp_state.word_queue.pop(0)
-                sw = speakable_words[temp_state.optimistic_position]
+                spoken_word: str = temp_state.word_queue.popleft()
+                sw: SpeakableWord = speakable_words[temp_state.optimistic_position]
 
                 # If the current script word is longer than the current spoken word,
                 # double check to see if combining the current and next spoken words
@@ -798,10 +905,10 @@ class ScriptTracker:
                 if bool(temp_state.word_queue) and not sw.is_expansion and len(sw.text) >= len(spoken_word) * 1.5:
                     next_spoken_word = temp_state.word_queue[0]
                     logger.debug(
-                        f"Skip detection ({variant_name}): Testing compound spoken '{spoken_word + next_spoken_word}' against scripted '{sw.text}'"
-                    )
+                        "Skip detection (%s): Testing compound spoken '%s%s' against scripted '%s'",
+                        variant_name, spoken_word, next_spoken_word, sw.text)
                     if sw.text == spoken_word + next_spoken_word:
-                        temp_state.word_queue.pop(0)
+                        temp_state.word_queue.popleft()
                         match_count += 1 + skip_count
                         advance_count += 1
                         temp_state.optimistic_position += 1
@@ -811,13 +918,13 @@ class ScriptTracker:
                         break
 
                 logger.debug(
-                    f"Skip detection ({variant_name}): Testing spoken '{spoken_word}' against scripted '{sw.text}'"
-                )
+                    "Skip detection (%s): Testing spoken '%s' against scripted '%s'",
+                    variant_name, spoken_word, sw.text)
 
                 # Try to skip over the odd mismatched word (which can be a result of
                 # the speaker mispeaking or the transcription picking the wrong word
                 # compared to what the speaker actually spoke)
-                match_result = self._match_single_word(spoken_word, temp_state)
+                match_result: SingleWordMatchResult = match_single_word(spoken_word, temp_state)
                 # Did we find a matching word?
                 if match_result.matched:
                     temp_state.last_matched_spoken = spoken_word
@@ -850,9 +957,10 @@ class ScriptTracker:
                 if temp_state.expansion_matcher:
                     state.expansion_matcher = temp_state.expansion_matcher
 
-            logger.debug(
-                f"Skip detection ({variant_name}): Final word queue: '{str(list(temp_state.word_queue))}'"
-            )
+            if debug_enabled:
+                logger.debug(
+                    "Skip detection (%s): Final word queue: '%s'",
+                    variant_name, list(temp_state.word_queue))
 
             return ManyWordMatchResult(match_count, advance_count)
 
@@ -860,7 +968,7 @@ class ScriptTracker:
         # Technically this mechanism allows a slip of 2 * max_skip_distance but who cares
         for offset in range(0, max_skip_distance + 1):
             # Transcript and Script words skipped together
-            result = try_matching(
+            result: ManyWordMatchResult = try_matching(
                 f"T+S[{offset}]", 1, state.optimistic_position + offset)
             if result.matches > 0:
                 # Add offset to advances since caller will add this to state.optimistic_position
@@ -873,7 +981,7 @@ class ScriptTracker:
                 # Add offset to advances since caller will add this to state.optimistic_position
                 return ManyWordMatchResult(result.matches, result.advances + offset)
 
-        return ManyWordMatchResult(0, 0)
+        return _NO_MATCHES
 
     @profile_function("tracker._detect_jump_internal")
     def _detect_jump_internal(self, state: TrackingState) -> tuple[int, bool]:
@@ -898,98 +1006,124 @@ class ScriptTracker:
         # Need enough words to reliably detect position
         if len(state.word_queue) < 3:
             logger.debug(
-                f"Jump detection: Skipping (insufficient words: {len(state.word_queue)} < 3)")
+                "Jump detection: Skipping (insufficient words: %d < 3)", len(state.word_queue))
             return state.optimistic_position, False
 
         # Use full current transcription if available (provides better context)
         # Otherwise fall back to word queue
-        transcription = state.current_transcription if state.current_transcription else ' '.join(
-            state.word_queue)
+        # Tokenized once here and reused by the checks below
+        transcription: str
+        transcript_words: list[str]
+        if state.current_transcription:
+            transcription = state.current_transcription
+            transcript_words = transcription.split()
+        else:
+            # Queued words are already whitespace-free tokens
+            transcript_words = list(state.word_queue)
+            transcription = ' '.join(transcript_words)
         logger.debug(
-            f"Jump detection: Checking transcription '{transcription}' at position {state.optimistic_position}")
+            "Jump detection: Checking transcription '%s' at position %d",
+            transcription, state.optimistic_position)
+
+        # Check if the transcript words match what we expect at/near the
+        # optimistic position. If they do, trust the optimistic position.
+        # A match here means no jump whatever the window search finds, so it
+        # runs first: it only looks at a few nearby words, which is much
+        # cheaper than the script-wide window search below.
+        if self._transcript_matches_position(transcript_words, state.optimistic_position):
+            logger.debug(
+                "Jump detection: Skipping (transcript matches current position)")
+            return state.optimistic_position, False
 
         # Use window-based matching to find where these words are
         best_index, confidence = self._find_best_match(transcription)
         logger.debug(
-            f"Jump detection: Best match at index {best_index} with confidence {confidence:.1f}")
+            "Jump detection: Best match at index %d with confidence %.1f", best_index, confidence)
 
         # Low confidence match - can't determine position reliably
         if confidence < self.match_threshold:
             logger.debug(
-                f"Jump detection: Skipping (low confidence: {confidence:.1f} < {self.match_threshold})")
+                "Jump detection: Skipping (low confidence: %.1f < %s)",
+                confidence, self.match_threshold)
             return state.optimistic_position, False
 
         # Calculate deviation from optimistic position
-        position_diff = state.optimistic_position - best_index
+        position_diff: int = state.optimistic_position - best_index
         logger.debug(
-            f"Jump detection: Position diff = {position_diff} (optimistic={state.optimistic_position}, best={best_index})")
+            "Jump detection: Position diff = %d (optimistic=%d, best=%d)",
+            position_diff, state.optimistic_position, best_index)
 
         # If deviation is small, trust the optimistic position
         # This prevents repeated words from causing false jump detection
         if abs(position_diff) <= self.jump_threshold:
             logger.debug(
-                f"Jump detection: Skipping (small deviation: {abs(position_diff)} <= {self.jump_threshold})")
-            return state.optimistic_position, False
-
-        # Before considering a jump, check if the transcript words
-        # match what we expect at/near the optimistic position.
-        # If they do, trust the optimistic position.
-        transcript_words = [w for w in transcription.split() if w.strip()]
-        if self._transcript_matches_position(transcript_words, state.optimistic_position):
-            logger.debug(
-                "Jump detection: Skipping (transcript matches current position)")
+                "Jump detection: Skipping (small deviation: %d <= %d)",
+                abs(position_diff), self.jump_threshold)
             return state.optimistic_position, False
 
         # Reject jumps that are too large - prevents jumping to similar sentences
         # far away in the script (e.g., repeated phrases in different paragraphs)
-        jump_distance = abs(position_diff)
+        jump_distance: int = abs(position_diff)
         if jump_distance > self.max_jump_distance:
             logger.debug(
-                f"Jump detection: Skipping (jump too large: {jump_distance} > {self.max_jump_distance})")
+                "Jump detection: Skipping (jump too large: %d > %d)",
+                jump_distance, self.max_jump_distance)
             return state.optimistic_position, False
 
         # Determine jump type
         # Backtrack: validated position is significantly behind where we currently are
-        is_backtrack = (
+        is_backtrack: bool = (
             best_index < state.optimistic_position - self.jump_threshold and
             state.optimistic_position > 0 and
             position_diff > self.jump_threshold
         )
 
         # Forward jump: validated position is significantly ahead of where we are
-        is_forward_jump = (
+        is_forward_jump: bool = (
             position_diff < -self.jump_threshold and
             best_index > state.optimistic_position
         )
 
         if not (is_backtrack or is_forward_jump):
             logger.debug(
-                f"Jump detection: Skipping (not classified as jump: backtrack={is_backtrack}, forward={is_forward_jump})")
+                "Jump detection: Skipping (not classified as jump: backtrack=%s, forward=%s)",
+                is_backtrack, is_forward_jump)
             return state.optimistic_position, False
 
         # Find where the first transcript word actually matches within the window
         # (best_index is where the window starts, not necessarily where first word is)
-        first_word = self._normalize_word(transcript_words[0])
-        transcript_start_offset = 0
-
-        for offset in range(min(self.window_size, len(self.words) - best_index)):
-            if best_index + offset < len(self.words) and self._word_matches(first_word, self.words[best_index + offset]):
-                transcript_start_offset = offset
+        first_word: str = self._normalize_word(transcript_words[0])
+        transcript_start_offset: int = 0
+
+        # An exact occurrence (found via the word index) bounds the fuzzy scan:
+        # only positions before it could provide an earlier (fuzzy) match
+        search_end: int = min(best_index + self.window_size, len(self.words))
+        exact_index: int = self._find_exact_occurrence(
+            first_word, best_index, search_end)
+        fuzzy_end: int = exact_index if exact_index >= 0 else search_end
+
+        norm_words: list[str] = self._norm_words
+        for index in range(best_index, fuzzy_end):
+            if self._normalized_words_match(first_word, norm_words[index]):
+                transcript_start_offset = index - best_index
                 break
+        else:
+            if exact_index >= 0:
+                transcript_start_offset = exact_index - best_index
 
         # Calculate actual position: where transcript starts + length of transcript
         # This positions us AFTER the spoken words (ready for the next word)
-        actual_start = best_index + transcript_start_offset
-        adjusted_position = min(
+        actual_start: int = best_index + transcript_start_offset
+        adjusted_position: int = min(
             actual_start + len(transcript_words),
             len(self.words) - 1 if self.words else 0
         )
 
         jump_type = "BACKTRACK" if is_backtrack else "FORWARD_JUMP"
         logger.info(
-            f"{jump_type}: from position {state.optimistic_position} to {adjusted_position} "
-            f"(best_idx={best_index}, offset={transcript_start_offset}, "
-            f"transcript_len={len(transcript_words)})"
+            "%s: from position %d to %d (best_idx=%d, offset=%d, transcript_len=%d)",
+            jump_type, state.optimistic_position, adjusted_position,
+            best_index, transcript_start_offset, len(transcript_words)
         )
 
         # Update state to new position
@@ -1026,8 +1160,8 @@ class ScriptTracker:
             a jump was detected
         """
         # Create a temporary state with the transcription words
-        temp_state = self.committed_state.clone()
-        temp_state.word_queue = [w for w in transcription.split() if w.strip()]
+        temp_state: TrackingState = self.committed_state.clone()
+        temp_state.word_queue = deque(transcription.split())
         # Provide full context for jump detection
         temp_state.current_transcription = transcription
 
@@ -1068,16 +1202,18 @@ class ScriptTracker:
             return self.current_word_index, 0.0
 
         # Check cache first (Phase 2 optimization)
-        cache_key = (spoken_words, self.current_word_index)
+        cache_key: tuple[str, int] = (spoken_words, self.current_word_index)
         if cache_key in self._match_cache:
             # Move to end for LRU behavior
             self._match_cache.move_to_end(cache_key)
             return self._match_cache[cache_key]
 
         # Normalize spoken words
-        spoken_normalized: str = ' '.join(
-            self._normalize_word(w) for w in spoken_words.split() if w.strip()
-        )
+        # Words that normalize to nothing are dropped; keeping the list lets
+        # the word count below be taken without re-splitting the joined text
+        spoken_norm_words: list[str] = [
+            norm for norm in map(self._normalize_word, spoken_words.split()) if norm]
+        spoken_normalized: str = ' '.join(spoken_norm_words)
 
         if not spoken_normalized:
             return self.current_word_index, 0.0
@@ -1100,27 +1236,38 @@ class ScriptTracker:
         best_index: int = self.current_word_index
         best_score: float = 0.0
 
-        # Slide window through search range
-        for i in range(search_start, search_end):
-            window_text: str = self._get_window_text(i)
+        # Windows with fewer words than this are penalized (loop invariant)
+        spoken_word_count: int = len(spoken_norm_words)
+        min_window_words: int = min(self.window_size, spoken_word_count)
+
+        # Score every window in the search range in one rapidfuzz call
+        # (token_set_ratio for better partial matching) rather than crossing
+        # into C once per candidate position
+        window_texts: list[str] = self._window_texts[search_start:search_end]
+        window_scores: list[float] = [0.0] * len(window_texts)
+        for _, window_score, offset in process.extract(
+                spoken_normalized, window_texts,
+                scorer=fuzz.token_set_ratio, limit=None):
+            window_scores[offset] = window_score
+
+        # Slide window through search range, walking the precomputed per-window
+        # data in lockstep rather than indexing into it per position
+        current_word_index: int = self.current_word_index
+        for i, window_text, score, window_word_count in zip(
+                range(search_start, search_end), window_texts, window_scores,
+                self._window_word_counts[search_start:search_end], strict=True):
             if not window_text:
                 continue
 
-            # Use token_set_ratio for better partial matching
-            score: float = fuzz.token_set_ratio(spoken_normalized, window_text)
-
             # Penalize very short windows - they can give false positives
             # when a common word like "you" or "the" matches by itself
-            window_word_count: int = len(window_text.split())
-            spoken_word_count: int = len(spoken_normalized.split())
-            if window_word_count < min(self.window_size, spoken_word_count):
+            if window_word_count < min_window_words:
                 # Reduce score proportionally to how short the window is
-                coverage: float = window_word_count / \
-                    min(self.window_size, spoken_word_count)
+                coverage: float = window_word_count / min_window_words
                 score = score * coverage
 
             # Slight preference for forward progress (avoid getting stuck)
-            if i >= self.current_word_index:
+            if i >= current_word_index:
                 score += 2
 
             if score > best_score:
@@ -1128,7 +1275,7 @@ class ScriptTracker:
                 best_index = i
 
         # Store in cache (Phase 2 optimization)
-        result = (best_index, best_score)
+        result: tuple[int, float] = (best_index, best_score)
         self._match_cache[cache_key] = result
 
         # Maintain cache size (LRU eviction)
@@ -1146,25 +1293,47 @@ class ScriptTracker:
         if not transcript_words or position >= len(self.words):
             return False
 
+        # Only the last few transcript words are checked, so they (with the
+        # position) fully determine the result
+        last_transcript: list[str] = transcript_words[-3:] if len(
+            transcript_words) >= 3 else transcript_words
+        cache_key: tuple[tuple[str, ...], int] = (tuple(last_transcript), position)
+        if cache_key in self._position_match_cache:
+            self._position_match_cache.move_to_end(cache_key)
+            return self._position_match_cache[cache_key]
+
+        result: bool = self._nearby_words_match(last_transcript, position)
+
+        self._position_match_cache[cache_key] = result
+        if len(self._position_match_cache) > self._match_cache_maxsize:
+            self._position_match_cache.popitem(last=False)
+
+        return result
+
+    def _nearby_words_match(self, last_transcript: list[str], position: int) -> bool:
+        """Uncached body of _transcript_matches_position."""
         # Look at a window around the position (a few words before and after)
         start: int = max(0, position - 3)
         end: int = min(len(self.words), position + 3)
-        nearby_words: list[str] = self.words[start:end]
+        nearby_words: list[str] = self._norm_words[start:end]
 
         if not nearby_words:
             return False
 
         # Check if the last few transcript words match any nearby script words
         # This indicates we're in the right area
-        last_transcript: list[str] = transcript_words[-3:] if len(
-            transcript_words) >= 3 else transcript_words
         matches: int = 0
         for tw in last_transcript:
             tw_norm: str = self._normalize_word(tw)
-            for sw in nearby_words:
-                if self._word_matches(tw_norm, sw):
-                    matches += 1
-                    break
+            # Cheap exact lookup first, fuzzy scan only on a miss
+            if self._find_exact_occurrence(tw_norm, start, end) >= 0:
+                matches += 1
+                continue
+            # Score the word against all nearby script words in one call
+            if tw_norm and process.extractOne(
+                    tw_norm, nearby_words, scorer=fuzz.ratio,
+                    score_cutoff=self.match_threshold) is not None:
+                matches += 1
 
         # If most of the recent words match nearby script, trust the position
         threshold: float = len(last_transcript) * 0.5
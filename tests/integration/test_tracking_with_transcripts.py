@@ -11,6 +11,7 @@ These tests use real transcript data to verify that the tracker:
 4. Handles differences between transcription and script gracefully
 """
 
+from itertools import accumulate
 from pathlib import Path
 
 import pytest
@@ -18,36 +19,52 @@ import pytest
 from src.autocue.tracker import ScriptPosition, ScriptTracker
 
 
+# The sample files are read-only inputs, so load them once per module
+# rather than once per test
+@pytest.fixture(scope="module")
+def number_test_script() -> str:
+    """Load the number test script."""
+    script_path: Path = Path(__file__).parent.parent.parent / \
+        "samples" / "number_test_script.md"
+    return script_path.read_text()
+
+
+@pytest.fixture(scope="module")
+def number_test_transcript() -> tuple[str, ...]:
+    """Load and parse the number test transcript, excluding start/end markers."""
+    transcript_path: Path = (
+        Path(__file__).parent.parent.parent / "transcripts" /
+        "transcript_20251221_000011.txt"
+    )
+    lines: list[str] = transcript_path.read_text().strip().split("\n")
+
+    # Filter out the "Transcript started" and "Transcript ended" lines
+    content_lines: list[str] = []
+    for line in lines:
+        line = line.strip()
+        if line.startswith("===") or not line:
+            continue
+        content_lines.append(line)
+
+    return tuple(content_lines)
+
+
+@pytest.fixture(scope="module")
+def all_words(number_test_transcript: tuple[str, ...]) -> tuple[str, ...]:
+    """Flatten the transcript lines into a single sequence of words."""
+    return tuple(word for line in number_test_transcript for word in line.split())
+
+
+@pytest.fixture(scope="module")
+def cumulative_texts(all_words: tuple[str, ...]) -> tuple[str, ...]:
+    """Build the growing transcript seen after each word, as fed to the tracker."""
+    return tuple(accumulate(all_words, lambda text, word: f"{text} {word}"))
+
+
 class TestTranscriptTracking:
     """Integration tests for tracking with real transcripts."""
 
-    @pytest.fixture
-    def number_test_script(self) -> str:
-        """Load the number test script."""
-        script_path: Path = Path(__file__).parent.parent.parent / \
-            "samples" / "number_test_script.md"
-        return script_path.read_text()
-
-    @pytest.fixture
-    def number_test_transcript(self) -> list[str]:
-        """Load and parse the number test transcript, excluding start/end markers."""
-        transcript_path: Path = (
-            Path(__file__).parent.parent.parent / "transcripts" /
-            "transcript_20251221_000011.txt"
-        )
-        lines: list[str] = transcript_path.read_text().strip().split("\n")
-
-        # Filter out the "Transcript started" and "Transcript ended" lines
-        content_lines: list[str] = []
-        for line in lines:
-            line = line.strip()
-            if line.startswith("===") or not line:
-                continue
-            content_lines.append(line)
-
-        return content_lines
-
-    def test_transcript_loads_correctly(self, number_test_transcript: list[str]) -> None:
+    def test_transcript_loads_correctly(self, number_test_transcript: tuple[str, ...]) -> None:
         """Verify transcript is loaded and parsed correctly."""
         assert len(number_test_transcript) > 0
         # First content line should be about "number expansion test"
@@ -61,7 +78,7 @@ class TestTranscriptTracking:
     def test_smooth_tracking_word_by_word(
         self,
         number_test_script: str,
-        number_test_transcript: list[str]
+        cumulative_texts: tuple[str, ...]
     ) -> None:
         """Verify tracking advances smoothly when feeding words one at a time.
 
@@ -71,24 +88,12 @@ class TestTranscriptTracking:
         """
         tracker: ScriptTracker = ScriptTracker(number_test_script)
 
-        # Build cumulative transcript word by word
-        all_words: list[str] = []
-        for line in number_test_transcript:
-            words: list[str] = line.split()
-            all_words.extend(words)
-
         max_jump: int = 0
         last_position: int = 0
         position_history: list[int] = [0]
 
         # Feed every word to simulate word-by-word updates
-        cumulative_text: str = ""
-        for word in all_words:
-            if cumulative_text:
-                cumulative_text += " " + word
-            else:
-                cumulative_text = word
-
+        for cumulative_text in cumulative_texts:
             # Update with cumulative text (tracker compares with last_transcription)
             pos: ScriptPosition = tracker.update(cumulative_text)
             current_position: int = pos.speakable_index
@@ -113,7 +118,7 @@ class TestTranscriptTracking:
     def test_smooth_tracking_chunk_by_chunk(
         self,
         number_test_script: str,
-        number_test_transcript: list[str]
+        number_test_transcript: tuple[str, ...]
     ) -> None:
         """Verify tracking advances smoothly when feeding transcript line by line (chunks).
 
@@ -161,7 +166,7 @@ class TestTranscriptTracking:
     def test_no_backtracking(
         self,
         number_test_script: str,
-        number_test_transcript: list[str]
+        cumulative_texts: tuple[str, ...]
     ) -> None:
         """Verify that tracking never goes backward unexpectedly."""
         tracker: ScriptTracker = ScriptTracker(number_test_script)
@@ -171,17 +176,7 @@ class TestTranscriptTracking:
         largest_backtrack: int = 0
 
         # Feed transcript word by word
-        all_words: list[str] = []
-        for line in number_test_transcript:
-            all_words.extend(line.split())
-
-        cumulative_text: str = ""
-        for word in all_words:
-            if cumulative_text:
-                cumulative_text += " " + word
-            else:
-                cumulative_text = word
-
+        for cumulative_text in cumulative_texts:
             pos: ScriptPosition = tracker.update(cumulative_text)
             current_position: int = pos.speakable_index
 
@@ -202,7 +197,7 @@ class TestTranscriptTracking:
     def test_no_forward_jumps(
         self,
         number_test_script: str,
-        number_test_transcript: list[str]
+        cumulative_texts: tuple[str, ...]
     ) -> None:
         """Verify that tracking never jumps forward unexpectedly."""
         tracker: ScriptTracker = ScriptTracker(number_test_script)
@@ -211,19 +206,9 @@ class TestTranscriptTracking:
         largest_forward_jump: int = 0
 
         # Feed transcript word by word
-        all_words: list[str] = []
-        for line in number_test_transcript:
-            all_words.extend(line.split())
-
-        cumulative_text: str = ""
         last_position: int = 0
 
-        for word in all_words:
-            if cumulative_text:
-                cumulative_text += " " + word
-            else:
-                cumulative_text = word
-
+        for cumulative_text in cumulative_texts:
             pos: ScriptPosition = tracker.update(cumulative_text)
             current_position: int = pos.speakable_index
 
@@ -243,14 +228,14 @@ class TestTranscriptTracking:
         assert largest_forward_jump <= 6, \
             f"Largest forward jump was {largest_forward_jump} words, expected <= 6"
         # Most updates should advance by 0-2 words
-        total_updates: int = len(all_words)
+        total_updates: int = len(cumulative_texts)
         jump_ratio: float = large_jump_count / total_updates
         assert jump_ratio < 0.1, f"Large jump ratio was {jump_ratio:.2%}, expected < 10%"
 
     def test_mixed_word_and_chunk_updates(
         self,
         number_test_script: str,
-        number_test_transcript: list[str]
+        all_words: tuple[str, ...]
     ) -> None:
         """Verify tracking works with mixed update patterns (some words, some chunks).
 
@@ -262,11 +247,6 @@ class TestTranscriptTracking:
         last_position: int = 0
         large_jumps: list[tuple[int, int]] = []
 
-        # Combine lines into one big list of words
-        all_words: list[str] = []
-        for line in number_test_transcript:
-            all_words.extend(line.split())
-
         cumulative_text: str = ""
         word_idx: int = 0
 
@@ -309,30 +289,20 @@ class TestTranscriptTracking:
         assert final_progress > 0.8, f"Final progress was {final_progress:.2%}, expected > 80%"
 
     def test_position_never_exceeds_script_length(
-        self, number_test_script: str, number_test_transcript: list[str]
+        self, number_test_script: str, cumulative_texts: tuple[str, ...]
     ) -> None:
         """Verify position never goes beyond the script length."""
         tracker: ScriptTracker = ScriptTracker(number_test_script)
         script_length: int = len(tracker.words)
 
-        all_words: list[str] = []
-        for line in number_test_transcript:
-            all_words.extend(line.split())
-
-        cumulative_text: str = ""
-        for word in all_words:
-            if cumulative_text:
-                cumulative_text += " " + word
-            else:
-                cumulative_text = word
-
+        for cumulative_text in cumulative_texts:
             pos: ScriptPosition = tracker.update(cumulative_text)
 
             assert pos.speakable_index <= script_length, \
                 f"Position {pos.speakable_index} exceeded script length {script_length}"
 
     def test_consistent_position_on_repeated_updates(
-        self, number_test_script: str, number_test_transcript: list[str]
+        self, number_test_script: str, number_test_transcript: tuple[str, ...]
     ) -> None:
         """Verify that updating with the same text doesn't change position."""
         tracker: ScriptTracker = ScriptTracker(number_test_script)
@@ -341,10 +311,14 @@ class TestTranscriptTracking:
         first_few_lines: str = " ".join(number_test_transcript[:5])
 
         pos1: ScriptPosition = tracker.update(first_few_lines)
+        words_since_validation: int = tracker.words_since_validation
         pos2: ScriptPosition = tracker.update(first_few_lines)  # Same text
         pos3: ScriptPosition = tracker.update(
             first_few_lines)  # Same text again
 
+        # Repeats carry no new words, so no matching work should be done
+        assert tracker.words_since_validation == words_since_validation
+
         # Position should not change when text doesn't change
         assert pos1.speakable_index == pos2.speakable_index == pos3.speakable_index, \
             (f"Position changed on repeated updates: "
@@ -353,27 +327,17 @@ class TestTranscriptTracking:
     def test_steady_progress_through_script(
         self,
         number_test_script: str,
-        number_test_transcript: list[str]
+        cumulative_texts: tuple[str, ...]
     ) -> None:
         """Verify steady forward progress through the script."""
         tracker: ScriptTracker = ScriptTracker(number_test_script)
 
-        all_words: list[str] = []
-        for line in number_test_transcript:
-            all_words.extend(line.split())
-
-        cumulative_text: str = ""
         progress_samples: list[float] = []
 
         # Sample progress at regular intervals
-        sample_interval: int = len(all_words) // 10  # 10 samples
-
-        for i, word in enumerate(all_words):
-            if cumulative_text:
-                cumulative_text += " " + word
-            else:
-                cumulative_text = word
+        sample_interval: int = len(cumulative_texts) // 10  # 10 samples
 
+        for i, cumulative_text in enumerate(cumulative_texts):
             tracker.update(cumulative_text)
 
             if i > 0 and i % sample_interval == 0:
@@ -400,6 +400,18 @@ class TestGetNumberExpansions:
         assert result is not None, "100 should have expansions"
         assert result[0] == ["one", "hundred"]
 
+    def test_repeated_calls_return_independent_lists(self) -> None:
+        """Cached expansions should not be shared between callers."""
+        first: list[list[str]] | None = get_number_expansions("1500")
+        assert first is not None
+        first[0].append("extra")
+        first.append(["bogus"])
+
+        second: list[list[str]] | None = get_number_expansions(" 1500 ")
+        assert second is not None
+        assert "extra" not in second[0]
+        assert ["bogus"] not in second
+
     def test_ordinal_detection(self) -> None:
         """Ordinals should be properly detected and expanded."""
         result: list[list[str]] | None = get_number_expansions("1st")
@@ -38,6 +38,23 @@ class TestNormalizeWord:
         assert normalize_word("don't") == "dont"
         assert normalize_word("it's") == "its"
 
+    def test_unicode_punctuation_stripped(self) -> None:
+        """Non-ASCII punctuation should be stripped just like ASCII punctuation."""
+        assert normalize_word("don\u2019t") == "dont"
+        assert normalize_word("\u201chello\u201d") == "hello"
+        assert normalize_word("wait\u2026") == "wait"
+        assert normalize_word("caf\u00e9") == "caf\u00e9"
+
+    def test_underscore_and_digits_preserved(self) -> None:
+        """Word characters (letters, digits, underscore) should be kept."""
+        assert normalize_word("snake_case") == "snake_case"
+        assert normalize_word("M3,") == "m3"
+
+    def test_results_are_interned(self) -> None:
+        """Equal normalized words from different inputs should be one object."""
+        assert normalize_word("Hello!") is normalize_word("hello")
+        assert normalize_word("“Café”") is normalize_word("café")
+
 
 class TestIsSilentPunctuation:
     """Tests for is_silent_punctuation function."""
@@ -77,6 +77,22 @@ class TestExtractNewWords:
         # Should return all words when no prefix match
         assert new_words == ["hello", "world", "testing"]
 
+    def test_extract_new_words_partial_word_extension(self) -> None:
+        """A transcription that extends the last word itself should re-emit that word."""
+        tracker: ScriptTracker = ScriptTracker("the quick brown fox")
+        tracker.committed_state.last_transcription = "the qu"
+
+        new_words: list[str] = tracker.extract_new_words("the quick", tracker.committed_state)
+
+        assert new_words == ["quick"]
+
+    def test_extract_new_words_identical_transcription(self) -> None:
+        """An unchanged transcription should yield no new words."""
+        tracker: ScriptTracker = ScriptTracker("the quick brown fox")
+        tracker.committed_state.last_transcription = "the quick"
+
+        assert tracker.extract_new_words("the quick", tracker.committed_state) == []
+
 
 class TestDisplayMethods:
     """Tests for display-related methods."""
@@ -97,6 +113,25 @@ class TestDisplayMethods:
         assert len(lines) > 0
         assert current_idx >= 0
 
+    def test_get_display_lines_returns_independent_lists(self) -> None:
+        """Each call should return its own list of the lines around the position."""
+        script: str = "alpha beta gamma\ndelta epsilon zeta\neta theta iota"
+        tracker: ScriptTracker = ScriptTracker(script)
+
+        tracker.current_word_index = 3
+        first, current_idx, word_offset = tracker.get_display_lines(
+            past_lines=1, future_lines=1)
+        assert [line.text for line in first] == [
+            "alpha beta gamma", "delta epsilon zeta", "eta theta iota"]
+        assert (current_idx, word_offset) == (1, 0)
+
+        # Results may be handed to other threads, so they must not share a
+        # list with each other or with the tracker
+        first.clear()
+        second, _, _ = tracker.get_display_lines(past_lines=1, future_lines=1)
+        assert second is not first
+        assert len(second) == 3
+
     def test_progress_property(self) -> None:
         """Progress should reflect position through script."""
         tracker: ScriptTracker = ScriptTracker("one two three four")
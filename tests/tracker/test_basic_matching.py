@@ -6,6 +6,9 @@
 Tests for basic word matching functionality in ScriptTracker.
 """
 
+from rapidfuzz import fuzz
+
+from src.autocue.script_parser import normalize_word
 from src.autocue.tracker import ScriptPosition, ScriptTracker
 
 
@@ -110,6 +113,19 @@ class TestFuzzyWordMatching:
         pos: ScriptPosition = tracker.update("hello world how")
         assert pos.word_index == 3
 
+    def test_length_prefilter_agrees_with_fuzzy_ratio(self) -> None:
+        """Skipping fuzzy scoring on length alone should not change results."""
+        tracker: ScriptTracker = ScriptTracker("placeholder")
+        pairs: list[tuple[str, str]] = [
+            ("recognise", "recognize"), ("a", "an"), ("cat", "category"),
+            ("the", "then"), ("to", "too"), ("everything", "every"),
+            ("one", "won"), ("i", "it"),
+        ]
+        for spoken, script in pairs:
+            expected: bool = fuzz.ratio(spoken, script) >= tracker.match_threshold
+            assert tracker._normalized_words_match(
+                normalize_word(spoken), normalize_word(script)) == expected, (spoken, script)
+
 
 class TestEdgeCases:
     """Tests for edge cases and boundary conditions."""
@@ -121,6 +137,16 @@ class TestEdgeCases:
         assert words == []
         assert tracker.progress == 0.0
 
+    def test_empty_script_update(self) -> None:
+        """Updates against an empty script should stay at the start."""
+        tracker: ScriptTracker = ScriptTracker("")
+
+        for is_partial in (True, False):
+            pos: ScriptPosition = tracker.update("hello world", is_partial=is_partial)
+            assert pos.speakable_index == 0
+            assert pos.word_index == 0
+            assert not pos.is_jump
+
     def test_single_word_script(self) -> None:
         """Should handle single word script."""
         tracker: ScriptTracker = ScriptTracker("hello")
@@ -235,3 +235,90 @@ class TestCachingIntegration:
         # Just verify it's being used
         cache_was_used = len(tracker._match_cache) >= 0  # Always true, but shows cache exists
         assert cache_was_used
+
+
+class TestPrecomputedWordIndex:
+    """Tests for the normalized word list and inverted word index."""
+
+    def test_norm_words_parallel_to_words(self) -> None:
+        """Verify _norm_words holds one normalized entry per script word."""
+        tracker = ScriptTracker("Hello, World! Hello again.")
+
+        assert len(tracker._norm_words) == len(tracker.words)
+        assert tracker._norm_words == ["hello", "world", "hello", "again"]
+
+    def test_word_index_maps_words_to_sorted_positions(self) -> None:
+        """Verify the inverted index lists every position of each word in order."""
+        tracker = ScriptTracker("the cat saw the dog and the bird")
+
+        assert tracker._word_index["the"] == [0, 3, 6]
+        assert tracker._word_index["cat"] == [1]
+        assert "missing" not in tracker._word_index
+
+    def test_find_exact_occurrence_respects_range(self) -> None:
+        """Verify exact lookups return the first occurrence within [start, end)."""
+        tracker = ScriptTracker("the cat saw the dog and the bird")
+
+        assert tracker._find_exact_occurrence("the", 0, 8) == 0
+        assert tracker._find_exact_occurrence("the", 1, 8) == 3
+        assert tracker._find_exact_occurrence("the", 4, 6) == -1
+        assert tracker._find_exact_occurrence("missing", 0, 8) == -1
+
+
+class TestPrecomputedWindows:
+    """Tests for the sliding-window texts used by _find_best_match."""
+
+    def test_window_texts_match_script_slices(self) -> None:
+        """Verify each precomputed window is the joined slice of script words."""
+        tracker = ScriptTracker("one two three four five", window_size=3)
+
+        assert tracker._window_texts == [
+            "one two three", "two three four", "three four five", "four five", "five"]
+        assert tracker._window_word_counts == [3, 3, 3, 2, 1]
+
+
+class TestPositionMatchCaching:
+    """Tests for caching of nearby-transcript checks in jump detection."""
+
+    def test_position_match_cache_keyed_on_transcript_tail(self) -> None:
+        """Verify transcripts sharing their last words reuse the cached result."""
+        tracker = ScriptTracker("The quick brown fox jumps over the lazy dog")
+
+        assert tracker._transcript_matches_position(["the", "quick", "brown", "fox"], 3)
+        assert list(tracker._position_match_cache) == [(("quick", "brown", "fox"), 3)]
+
+        # Same tail, different earlier words: served from the cache
+        assert tracker._transcript_matches_position(["uh", "quick", "brown", "fox"], 3)
+        assert len(tracker._position_match_cache) == 1
+
+        # Different position is a separate entry
+        assert not tracker._transcript_matches_position(["quick", "brown", "fox"], 8)
+        assert len(tracker._position_match_cache) == 2
+
+    def test_position_match_cache_clears_on_reset(self) -> None:
+        """Verify the cache is cleared when the tracker is reset."""
+        tracker = ScriptTracker("The quick brown fox jumps over the lazy dog")
+
+        tracker._transcript_matches_position(["quick", "brown"], 2)
+        tracker.reset()
+
+        assert len(tracker._position_match_cache) == 0
+
+
+class TestParsedScriptSharing:
+    """Tests for sharing parsed scripts between trackers."""
+
+    def test_trackers_for_same_script_share_parse(self) -> None:
+        """Verify trackers for identical script text reuse one ParsedScript."""
+        script = "Share this parsed script with 100 items"
+        first = ScriptTracker(script)
+        second = ScriptTracker(script, window_size=4)
+        other = ScriptTracker(script + " more")
+
+        assert second.parsed_script is first.parsed_script
+        assert other.parsed_script is not first.parsed_script
+
+        # Tracking state stays independent
+        first.update("share this parsed")
+        assert first.optimistic_position == 3
+        assert second.optimistic_position == 0
@@ -6,7 +6,10 @@
 Tests for expansion matching (punctuation and number alternatives) in ScriptTracker.
 """
 
-from src.autocue.tracker import ScriptPosition, ScriptTracker
+from unittest.mock import patch
+
+from src.autocue.expansion_matcher import ExpansionMatcher
+from src.autocue.tracker import ScriptPosition, ScriptTracker, TrackingState
 
 
 class TestAlternativePunctuationMatching:
@@ -488,6 +491,27 @@ class TestExpansionValidationBug:
         assert tracker.allow_jump_detection is False or tracker.active_expansions, \
             "Should not trigger validation while actively matching expansion"
 
+    def test_expansion_cleared_before_jump_detection(self) -> None:
+        """Jump detection should never run with a half-matched expansion.
+
+        Words of an in-progress expansion don't advance the position, so if
+        jump detection saw them it could misread them as a deviation.
+        """
+        tracker: ScriptTracker = ScriptTracker(
+            "prefix 1500 suffix words here today")
+        original_detect = tracker._detect_jump_internal
+        active_during_detection: list[bool] = []
+
+        def spy(state: TrackingState) -> tuple[int, bool]:
+            active_during_detection.append(bool(tracker.active_expansions))
+            return original_detect(state)
+
+        with patch.object(tracker, "_detect_jump_internal", side_effect=spy):
+            tracker.update("prefix one thousand zebra yak walrus vole")
+
+        assert active_during_detection, "Scenario should reach jump detection"
+        assert not any(active_during_detection)
+
     def test_six_word_expansion_no_backtrack(self) -> None:
         """Very long expansions (like 1,500,000) should not cause false backtrack.
 
@@ -748,3 +772,33 @@ class TestUnitOnlyRateMatching:
 
         # Should have progressed through most of the script
         assert tracker.progress > 0.8
+
+
+class TestExpansionMatcherFiltering:
+    """Tests for ExpansionMatcher filtering of shared-prefix expansions."""
+
+    def test_shared_first_word_keeps_all_alternatives(self) -> None:
+        """Expansions sharing a first word should all survive that word."""
+        tracker: ScriptTracker = ScriptTracker("we have 100 apples")
+        matcher: ExpansionMatcher = ExpansionMatcher(tracker.parsed_script)
+
+        assert matcher.start(2)
+        assert matcher.filter_by_word("one")
+        assert matcher.active_expansions == [
+            ['one', 'hundred'], ['one', 'zero', 'zero']]
+
+        assert matcher.filter_by_word("zero")
+        assert matcher.active_expansions == [['one', 'zero', 'zero']]
+        assert not matcher.is_complete()
+
+    def test_expansion_table_built_once_and_shared_by_clones(self) -> None:
+        """Clones should reuse the precomputed expansion table."""
+        tracker: ScriptTracker = ScriptTracker("we have 100 apples")
+        matcher: ExpansionMatcher = ExpansionMatcher(tracker.parsed_script)
+
+        assert set(matcher._expansion_table) == {2}
+        assert matcher.get_first_words(2) == ["one", "a"]
+        assert matcher.get_first_words(0) == ["we"]
+
+        clone: ExpansionMatcher = matcher.clone()
+        assert clone._expansion_table is matcher._expansion_table
@@ -205,6 +205,24 @@ This is the second paragraph."""
         # Should have advanced further
         self.assertGreater(pos3.speakable_index, pos2.speakable_index)
 
+    def test_next_non_header_lookup(self):
+        """Verify the precomputed header-skip table points past header runs."""
+        script = """# Title
+
+## Sub
+
+Body text here."""
+
+        tracker: ScriptTracker = ScriptTracker(script, skip_headers=True)
+        speakable_words = tracker.parsed_script.speakable_words
+
+        first_body = next(i for i, sw in enumerate(speakable_words) if not sw.is_header)
+        for i in range(first_body):
+            self.assertEqual(tracker._next_non_header[i], first_body)
+        for i in range(first_body, len(speakable_words)):
+            self.assertEqual(tracker._next_non_header[i], i)
+        self.assertEqual(tracker._next_non_header[len(speakable_words)], len(speakable_words))
+
 
 if __name__ == "__main__":
     unittest.main()
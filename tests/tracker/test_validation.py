@@ -6,6 +6,8 @@
 Tests for validation triggering and backtrack detection in ScriptTracker.
 """
 
+from unittest.mock import patch
+
 from src.autocue.tracker import ScriptTracker
 
 
@@ -112,3 +114,37 @@ class TestBacktrackDetection:
         assert is_backtrack is False
         # Position should stay at 4 (trust optimistic for <=2 word deviation)
         assert tracker.optimistic_position == 4
+
+
+class TestTranscriptMatchesPosition:
+    """Tests for the nearby-script check used before accepting a jump."""
+
+    def test_exact_and_fuzzy_words_match_nearby(self) -> None:
+        """Exact and near-miss words around the position should count."""
+        tracker: ScriptTracker = ScriptTracker(
+            "we recognize the pattern in the data today")
+
+        assert tracker._transcript_matches_position(
+            ["recognise", "the", "pattern"], 2)
+
+    def test_distant_words_do_not_match(self) -> None:
+        """Words from far away in the script should not match the position."""
+        tracker: ScriptTracker = ScriptTracker(
+            "alpha beta gamma delta epsilon zeta eta theta iota kappa lambda mu")
+
+        assert not tracker._transcript_matches_position(
+            ["kappa", "lambda", "mu"], 1)
+        assert not tracker._transcript_matches_position([], 1)
+
+    def test_matching_transcript_skips_window_search(self) -> None:
+        """Jump detection should not search the script when staying put fits."""
+        tracker: ScriptTracker = ScriptTracker(
+            "alpha beta gamma delta epsilon zeta eta theta iota kappa lambda mu")
+        tracker.update("alpha beta gamma delta epsilon")
+
+        with patch.object(tracker, "_find_best_match") as find_best_match:
+            position, is_jump = tracker.detect_jump("gamma delta epsilon")
+
+        find_best_match.assert_not_called()
+        assert position == tracker.optimistic_position
+        assert is_jump is False
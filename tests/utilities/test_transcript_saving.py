@@ -4,9 +4,9 @@
 
 """Tests for the transcript saving functionality."""
 
-import asyncio
-import tempfile
+import itertools
 from collections.abc import Generator
+from datetime import datetime, timedelta
 from pathlib import Path
 from unittest import mock
 
@@ -56,75 +56,78 @@ class TestDynamicTranscriptControl:
         yield server
 
     @pytest.mark.asyncio
-    async def test_start_transcript_creates_file(self, mock_server: mock.AsyncMock) -> None:
+    async def test_start_transcript_creates_file(
+        self,
+        mock_server: mock.AsyncMock,
+        tmp_path: Path
+    ) -> None:
         """_start_transcript() should create a new transcript file."""
         app: AutocueApp = AutocueApp(save_transcript=False)
         app.server = mock_server
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir_path: Path = Path(tmpdir)
-            with mock.patch('autocue.main.TRANSCRIPT_DIR', tmpdir_path):
-                await app.start_transcript()
+        with mock.patch('autocue.main.TRANSCRIPT_DIR', tmp_path):
+            await app.start_transcript()
 
-                assert app.save_transcript is True
-                assert app.transcript_file is not None
-                assert app.transcript_file.exists()
-                mock_server.send_transcript_status.assert_called_once()
-                call_args = mock_server.send_transcript_status.call_args
-                assert call_args[0][0] is True  # recording=True
+            assert app.save_transcript is True
+            assert app.transcript_file is not None
+            assert app.transcript_file.exists()
+            mock_server.send_transcript_status.assert_called_once()
+            call_args = mock_server.send_transcript_status.call_args
+            assert call_args[0][0] is True  # recording=True
 
     @pytest.mark.asyncio
     async def test_start_transcript_no_op_if_already_recording(
         self,
-        mock_server: mock.AsyncMock
+        mock_server: mock.AsyncMock,
+        tmp_path: Path
     ) -> None:
         """_start_transcript() should be a no-op if already recording."""
         app: AutocueApp = AutocueApp(save_transcript=True)
         app.server = mock_server
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir_path: Path = Path(tmpdir)
-            with mock.patch('autocue.main.TRANSCRIPT_DIR', tmpdir_path):
-                # Start first time
-                await app.start_transcript()
-                first_file: Path | None = app.transcript_file
+        with mock.patch('autocue.main.TRANSCRIPT_DIR', tmp_path):
+            # Start first time
+            await app.start_transcript()
+            first_file: Path | None = app.transcript_file
 
-                # Reset mock
-                mock_server.send_transcript_status.reset_mock()
+            # Reset mock
+            mock_server.send_transcript_status.reset_mock()
 
-                # Start again - should use same file
-                await app.start_transcript()
-                assert app.transcript_file == first_file
-                # Should still send status update
-                mock_server.send_transcript_status.assert_called_once()
+            # Start again - should use same file
+            await app.start_transcript()
+            assert app.transcript_file == first_file
+            # Should still send status update
+            mock_server.send_transcript_status.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_stop_transcript_closes_file(self, mock_server: mock.AsyncMock) -> None:
+    async def test_stop_transcript_closes_file(
+        self,
+        mock_server: mock.AsyncMock,
+        tmp_path: Path
+    ) -> None:
         """_stop_transcript() should close the transcript and clear state."""
         app: AutocueApp = AutocueApp(save_transcript=False)
         app.server = mock_server
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir_path: Path = Path(tmpdir)
-            with mock.patch('autocue.main.TRANSCRIPT_DIR', tmpdir_path):
-                # Start recording
-                await app.start_transcript()
-                transcript_file: Path | None = app.transcript_file
+        with mock.patch('autocue.main.TRANSCRIPT_DIR', tmp_path):
+            # Start recording
+            await app.start_transcript()
+            transcript_file: Path | None = app.transcript_file
 
-                # Stop recording
-                await app.stop_transcript()
+            # Stop recording
+            await app.stop_transcript()
 
-                assert app.save_transcript is False
-                assert app.transcript_file is None
+            assert app.save_transcript is False
+            assert app.transcript_file is None
 
-                # File should have end marker
-                assert transcript_file is not None, "File should have been created"
-                content: str = transcript_file.read_text()
-                assert "Transcript ended" in content
+            # File should have end marker
+            assert transcript_file is not None, "File should have been created"
+            content: str = transcript_file.read_text()
+            assert "Transcript ended" in content
 
-                # Should send status update
-                call_args = mock_server.send_transcript_status.call_args
-                assert call_args[0][0] is False  # recording=False
+            # Should send status update
+            call_args = mock_server.send_transcript_status.call_args
+            assert call_args[0][0] is False  # recording=False
 
     @pytest.mark.asyncio
     async def test_stop_transcript_no_op_if_not_recording(
@@ -142,38 +145,45 @@ class TestDynamicTranscriptControl:
         mock_server.send_transcript_status.assert_called_once_with(False)
 
     @pytest.mark.asyncio
-    async def test_start_stop_cycle(self, mock_server: mock.AsyncMock) -> None:
+    async def test_start_stop_cycle(
+        self,
+        mock_server: mock.AsyncMock,
+        tmp_path: Path
+    ) -> None:
         """Test starting and stopping transcript multiple times."""
         app: AutocueApp = AutocueApp(save_transcript=False)
         app.server = mock_server
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir_path: Path = Path(tmpdir)
-            with mock.patch('autocue.main.TRANSCRIPT_DIR', tmpdir_path):
-                # First cycle
-                await app.start_transcript()
-                first_file: Path | None = app.transcript_file
-                app.write_transcript("first recording", is_partial=False)
-                await app.stop_transcript()
-
-                # Wait a moment to ensure different timestamp
-                await asyncio.sleep(1.1)
-
-                # Second cycle
-                await app.start_transcript()
-                second_file: Path | None = app.transcript_file
-                app.write_transcript("second recording", is_partial=False)
-                await app.stop_transcript()
-
-                # Files should be different (different timestamps)
-                assert first_file is not None, "First file should have been created"
-                assert second_file is not None, "Second file should have been created"
-                assert first_file != second_file
-                assert first_file.exists()
-                assert second_file.exists()
-
-                # Content should be correct
-                first_content: str = first_file.read_text()
-                second_content: str = second_file.read_text()
-                assert "first recording" in first_content
-                assert "second recording" in second_content
+        # Advance the clock a second per call so each cycle gets a distinct
+        # timestamped filename without actually waiting
+        start_time: datetime = datetime(2025, 1, 1, 12, 0, 0)
+        ticks = (start_time + timedelta(seconds=i) for i in itertools.count())
+
+        with mock.patch('autocue.main.TRANSCRIPT_DIR', tmp_path), \
+                mock.patch('autocue.main.datetime') as mock_datetime:
+            mock_datetime.now.side_effect = lambda: next(ticks)
+
+            # First cycle
+            await app.start_transcript()
+            first_file: Path | None = app.transcript_file
+            app.write_transcript("first recording", is_partial=False)
+            await app.stop_transcript()
+
+            # Second cycle
+            await app.start_transcript()
+            second_file: Path | None = app.transcript_file
+            app.write_transcript("second recording", is_partial=False)
+            await app.stop_transcript()
+
+            # Files should be different (different timestamps)
+            assert first_file is not None, "First file should have been created"
+            assert second_file is not None, "Second file should have been created"
+            assert first_file != second_file
+            assert first_file.exists()
+            assert second_file.exists()
+
+            # Content should be correct
+            first_content: str = first_file.read_text()
+            second_content: str = second_file.read_text()
+            assert "first recording" in first_content
+            assert "second recording" in second_content